@@ -1,8 +1,15 @@
+import os
 import random
+import string
 import sys
 import logging
 import argparse
+import multiprocessing as mp
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from tqdm import tqdm
 
 # Import visualization if available
@@ -12,6 +19,13 @@ try:
 except ImportError:
     VIZ_AVAILABLE = False
 
+# Use the Numba-compiled Gibbs chain if available
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # ==========================================
 # PART 0: Logging & Configuration
 # ==========================================
@@ -27,89 +41,204 @@ def setup_logging(verbose=False):
 # PART 1: Helper Functions
 # ==========================================
 
-def get_profile(motifs):
-    k = len(motifs[0])
-    profile = {'A': [1.0]*k, 'C': [1.0]*k, 'G': [1.0]*k, 'T': [1.0]*k}
-    for motif in motifs:
-        for i, char in enumerate(motif):
-            profile[char][i] += 1
-    for i in range(k):
-        col_sum = sum(profile[nuc][i] for nuc in 'ACGT')
-        for nuc in 'ACGT':
-            profile[nuc][i] /= col_sum
-    return profile
+# DNA is stored as uint8 arrays (A=0, C=1, G=2, T=3); other bytes map to 255
+NUCLEOTIDES = 'ACGT'
+NT_ASCII = np.frombuffer(NUCLEOTIDES.encode(), dtype=np.uint8)
+NT_LUT = np.full(256, 255, dtype=np.uint8)
+NT_LUT[NT_ASCII] = np.arange(len(NUCLEOTIDES), dtype=np.uint8)
+
+# Byte-level equivalents of str.upper() and strip() for FASTA sequence lines
+UPPER = bytes.maketrans(string.ascii_lowercase.encode(), string.ascii_uppercase.encode())
+FASTA_WHITESPACE = b' \t\r\n'
+
+# Profiles, log-profiles and window scores are float32: 7 significant digits are far
+# more than argmax or a categorical draw can resolve, and the tables are half the size.
+# Sampling therefore differs from float64 only by rounding. Gumbel noise stays float64
+# because float32 uniforms hit exactly 0 often enough to produce infinite keys.
+PROFILE_DTYPE = np.float32
+
+# Chain seeds are reduced into the range accepted by Numba's np.random.seed and NumPy generators
+SEED_RANGE = 2**32
+
+def encode_sequence(seq):
+    return NT_LUT[np.frombuffer(seq.encode(), dtype=np.uint8)]
+
+def decode_sequence(seq_enc):
+    return NT_ASCII[seq_enc].tobytes().decode()
+
+@lru_cache(maxsize=None)
+def positions(k):
+    """
+    Read-only column indices 0..k-1, shared by every profile gather for a given k.
+    """
+    cols = np.arange(k)
+    cols.flags.writeable = False
+    return cols
+
+@dataclass(eq=False)
+class EncodedDNA:
+    """
+    The encoded sequences of one dataset, with lazily cached derived layouts
+    (window views per k, packed array) so repeated runs on it skip the setup.
+    Every sequence must contain only encoded ACGT values (0-3).
+    """
+    encoded: list
+    _windows: dict = field(default_factory=dict, init=False, repr=False)
+    _stacked_windows: dict = field(default_factory=dict, init=False, repr=False)
+    _packed: tuple = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        # Non-ACGT bases encode to 255, which would index past the 4-row count matrix
+        for i, seq in enumerate(self.encoded):
+            if (seq > 3).any():
+                raise ValueError(f"Sequence {i} contains non-ACGT bases")
+
+    def __len__(self):
+        return len(self.encoded)
+
+    def __getitem__(self, i):
+        return self.encoded[i]
+
+    def __iter__(self):
+        return iter(self.encoded)
+
+    def __getstate__(self):
+        # Caches are cheap to rebuild and window views would pickle as full copies
+        return {'encoded': self.encoded}
+
+    def __setstate__(self, state):
+        self.__init__(state['encoded'])
+
+    def windows(self, k):
+        """
+        One (L, k) sliding-window view per sequence.
+        """
+        if k not in self._windows:
+            self._windows[k] = [sliding_window_view(seq, k) for seq in self.encoded]
+        return self._windows[k]
+
+    def stacked_windows(self, k):
+        """
+        A single (t, L, k) window view over all sequences; requires equal lengths.
+        """
+        if k not in self._stacked_windows:
+            self._stacked_windows[k] = sliding_window_view(np.stack(self.encoded), k, axis=1)
+        return self._stacked_windows[k]
+
+    def packed(self):
+        """
+        The sequences concatenated into one array plus (t + 1) start offsets,
+        the layout used by the compiled Gibbs chain.
+        """
+        if self._packed is None:
+            offsets = np.zeros(len(self.encoded) + 1, dtype=np.int64)
+            offsets[1:] = np.cumsum([len(seq) for seq in self.encoded])
+            self._packed = (np.concatenate(self.encoded), offsets)
+        return self._packed
 
-def profile_most_probable_kmer(text, k, profile):
+def get_profile(motifs_arr):
+    """
+    Builds the unnormalized 4 x k profile (counts + 1 pseudocount) of a (t, k) uint8 motif array.
+    Every column sums to t + 4, so normalizing would only shift each window's log-score
+    by the same constant, which changes neither the argmax nor a proportional draw.
+    """
+    return count_motifs(motifs_arr).astype(PROFILE_DTYPE) + 1
+
+def held_out_log_profile(counts):
+    """
+    Unnormalized float32 log-profile of the Gibbs held-out counts (+1 pseudocounts),
+    skipping the constant column total as in get_profile.
+    Works on one (4, k) count matrix or a (chains, 4, k) batch.
+    """
+    return np.log((counts + 1).astype(PROFILE_DTYPE))
+
+def _score_windows(windows, log_profile):
+    """
+    Shared window-scoring kernel: the summed log-profile of every k-mer window.
+    (L, k) windows with a (4, k) log-profile give (L,) scores; (chains, L, k) windows
+    with a (chains, 4, k) batch of log-profiles give (chains, L).
+    """
+    cols = positions(windows.shape[-1])
+    if log_profile.ndim == 3:
+        chains = np.arange(log_profile.shape[0])[:, None, None]
+        return log_profile[chains, windows, cols].sum(axis=-1)
+    return log_profile[windows, cols].sum(axis=-1)
+
+def _select(scores, mode, rng=None):
+    """
+    Picks a window index from its scores along the last axis: 'max' takes the argmax,
+    'sample' draws from softmax(scores) of a single sequence using `rng`.
+    """
+    if mode == 'max':
+        return scores.argmax(axis=-1)
+    if mode == 'sample':
+        cum = np.cumsum(np.exp(scores - scores.max()))
+        # The clamp guards against u * cum[-1] rounding up to cum[-1] itself
+        i = np.searchsorted(cum, rng.random() * cum[-1], side='right')
+        return min(i, len(scores) - 1)
+    raise ValueError(f"Unknown selection mode '{mode}'")
+
+def profile_most_probable_kmer(windows, log_profile):
     """
     REQUIRED FOR GREEDY ALGORITHM: Finds the most probable k-mer.
+    Scores every window of a sequence's (L, k) sliding-window view at once
+    as a sum of log-probabilities.
     """
-    max_prob = -1
-    best_kmer = text[:k]
-    
-    for i in range(len(text) - k + 1):
-        kmer = text[i:i+k]
-        prob = 1.0
-        for j, char in enumerate(kmer):
-            prob *= profile[char][j]
-        
-        if prob > max_prob:
-            max_prob = prob
-            best_kmer = kmer
-    return best_kmer
+    return windows[_select(_score_windows(windows, log_profile), 'max')]
 
-def profile_randomly_generated_kmer(text, k, profile):
+def profile_randomly_generated_kmer(windows, log_profile, rng):
     """
     REQUIRED FOR GIBBS SAMPLER: Stochastically selects a k-mer.
+    Windows are drawn from a softmax over their log-probabilities by a binary search
+    of one scaled uniform in the unnormalized cumulative weights.
+    `rng` is the chain's np.random.Generator.
     """
-    probabilities = []
-    kmers = []
-    for i in range(len(text) - k + 1):
-        kmer = text[i:i+k]
-        prob = 1.0
-        for j, char in enumerate(kmer):
-            prob *= profile[char][j]
-        probabilities.append(prob)
-        kmers.append(kmer)
-    
-    total_prob = sum(probabilities)
-    if total_prob == 0:
-        return random.choice(kmers)
-    
-    normalized_probs = [p / total_prob for p in probabilities]
-    return random.choices(kmers, weights=normalized_probs, k=1)[0]
-
-def score_motifs(motifs):
-    score = 0
-    k = len(motifs[0])
-    for i in range(k):
-        column = [motif[i] for motif in motifs]
-        max_count = 0
-        for nuc in 'ACGT':
-            count = column.count(nuc)
-            if count > max_count:
-                max_count = count
-        score += (len(motifs) - max_count)
-    return score
+    return windows[_select(_score_windows(windows, log_profile), 'sample', rng)]
+
+def count_motifs(motifs_arr):
+    """
+    Counts each nucleotide per column of a (t, k) uint8 motif array, giving a 4 x k matrix.
+    """
+    k = motifs_arr.shape[1]
+    counts = np.zeros((4, k), dtype=np.int64)
+    np.add.at(counts, (motifs_arr, positions(k)), 1)
+    return counts
+
+def score_motifs(motifs_arr):
+    t, k = motifs_arr.shape
+    return int(t * k - count_motifs(motifs_arr).max(axis=0).sum())
 
 def load_fasta(filename):
-    sequences = []
-    current_seq = []
+    """
+    Reads the whole file at once and encodes each record straight from bytes.
+    """
     try:
-        with open(filename, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line: continue
-                if line.startswith(">"):
-                    if current_seq: sequences.append("".join(current_seq))
-                    current_seq = []
-                else:
-                    current_seq.append(line.upper())
-            if current_seq: sequences.append("".join(current_seq))
-        logging.info(f"Loaded {len(sequences)} sequences from {filename}")
-        return sequences
+        with open(filename, 'rb') as f:
+            records = f.read().split(b'\n>')
     except FileNotFoundError:
         logging.error(f"File '{filename}' not found.")
-        return []
+        return EncodedDNA([])
+
+    sequences = []
+    skipped = 0
+    for n, record in enumerate(records):
+        if n == 0 and not record.startswith(b'>'):
+            # Sequence lines before the first header are kept as their own record
+            seq = record
+        else:
+            _, _, seq = record.partition(b'\n')
+        seq = seq.translate(UPPER, FASTA_WHITESPACE)
+        if not seq: continue
+        seq_enc = NT_LUT[np.frombuffer(seq, dtype=np.uint8)]
+        # Non-ACGT bases (e.g. N) encode to 255, which would index past the 4-row profile
+        if (seq_enc == 255).any():
+            skipped += 1
+            continue
+        sequences.append(seq_enc)
+    if skipped:
+        logging.warning(f"Skipped {skipped} sequences containing non-ACGT bases")
+    logging.info(f"Loaded {len(sequences)} sequences from {filename}")
+    return EncodedDNA(sequences)
 
 def save_results_report(filename, csv_filename, best_motifs, best_score, args, t):
     with open(filename, "w") as f:
@@ -141,66 +270,251 @@ def save_results_report(filename, csv_filename, best_motifs, best_score, args, t
 def randomized_greedy_search(dna, k, t):
     """
     BASELINE ALGORITHM: Deterministic greedy search.
+    Returns the best motifs as a (t, k) uint8 array.
     """
-    n = len(dna[0])
-    motifs = []
-    for seq in dna:
-        r = random.randint(0, n - k)
-        motifs.append(seq[r:r+k])
+    windows = dna.windows(k)
+    motifs = np.stack([seq_windows[random.randint(0, len(seq_windows) - 1)] for seq_windows in windows])
         
-    best_motifs = motifs[:]
+    best_motifs = motifs
+    best_score = score_motifs(best_motifs)
     
     while True:
-        profile = get_profile(motifs)
-        motifs = []
-        for seq in dna:
-            motifs.append(profile_most_probable_kmer(seq, k, profile))
+        log_profile = np.log(get_profile(motifs))
+        motifs = np.stack([profile_most_probable_kmer(seq_windows, log_profile) for seq_windows in windows])
             
-        if score_motifs(motifs) < score_motifs(best_motifs):
-            best_motifs = motifs[:]
+        current_score = score_motifs(motifs)
+        if current_score < best_score:
+            best_motifs = motifs
+            best_score = current_score
         else:
             return best_motifs
 
-def gibbs_sampler_chain(dna, k, t, N):
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _get_counts(motifs):
+        t, k = motifs.shape
+        counts = np.zeros((4, k), dtype=np.int64)
+        for r in range(t):
+            for j in range(k):
+                counts[motifs[r, j], j] += 1
+        return counts
+
+    @njit(cache=True, fastmath=True)
+    def _score_counts(counts, t):
+        score = 0
+        for j in range(counts.shape[1]):
+            score += t - counts[:, j].max()
+        return score
+
+    @njit(cache=True, fastmath=True)
+    def _score_windows_jit(seq, k, log_profile):
+        # Compiled counterpart of _score_windows for one sequence
+        n_windows = seq.shape[0] - k + 1
+        logits = np.empty(n_windows, dtype=np.float32)
+        for i in range(n_windows):
+            total = np.float32(0.0)
+            for j in range(k):
+                total += log_profile[seq[i + j], j]
+            logits[i] = total
+        return logits
+
+    @njit(cache=True, fastmath=True)
+    def _sample_kmer(seq, k, log_profile):
+        logits = _score_windows_jit(seq, k, log_profile)
+        cum = np.cumsum(np.exp(logits - logits.max()))
+        i = np.searchsorted(cum, np.random.random() * cum[-1], side='right')
+        return min(i, logits.shape[0] - 1)
+
+    @njit(cache=True, fastmath=True)
+    def _gibbs_chain(dna_concat, offsets, k, t, N, seed):
+        # Numba keeps one random state per thread, so reseeding here makes each chain reproducible
+        np.random.seed(seed)
+        motifs = np.empty((t, k), dtype=np.uint8)
+        for r in range(t):
+            start = offsets[r] + np.random.randint(0, offsets[r + 1] - offsets[r] - k + 1)
+            motifs[r] = dna_concat[start:start + k]
+
+        counts = _get_counts(motifs)
+        best_motifs = motifs.copy()
+        best_score = _score_counts(counts, t)
+
+        for _ in range(N):
+            i = np.random.randint(0, t)
+            for j in range(k):
+                counts[motifs[i, j], j] -= 1
+            # Unnormalized, as the column total is the same constant for every window
+            log_profile = np.log((counts + 1).astype(np.float32))
+            seq = dna_concat[offsets[i]:offsets[i + 1]]
+            start = _sample_kmer(seq, k, log_profile)
+            motifs[i] = seq[start:start + k]
+            for j in range(k):
+                counts[motifs[i, j], j] += 1
+
+            current_score = _score_counts(counts, t)
+            if current_score < best_score:
+                best_motifs[:] = motifs
+                best_score = current_score
+
+        return best_motifs, best_score
+
+    @njit(cache=True, parallel=True)
+    def _gibbs_restarts(dna_concat, offsets, k, t, N, seeds):
+        restarts = seeds.shape[0]
+        all_motifs = np.empty((restarts, t, k), dtype=np.uint8)
+        all_scores = np.empty(restarts, dtype=np.int64)
+        for r in prange(restarts):
+            motifs, score = _gibbs_chain(dna_concat, offsets, k, t, N, seeds[r])
+            all_motifs[r] = motifs
+            all_scores[r] = score
+        return all_motifs, all_scores
+
+def gibbs_sampler_chain(dna, k, t, N, seed=None):
     """
     Single chain of the Gibbs Sampler.
+    All randomness comes from `seed`, so a fixed seed reproduces the chain.
     """
-    n_len = len(dna[0])
-    motifs = []
-    for seq in dna:
-        r = random.randint(0, n_len - k)
-        motifs.append(seq[r:r+k])
-        
-    best_motifs = motifs[:]
-    best_score = score_motifs(motifs)
+    seed = random.randrange(SEED_RANGE) if seed is None else seed % SEED_RANGE
+
+    if NUMBA_AVAILABLE:
+        dna_concat, offsets = dna.packed()
+        motifs, score = _gibbs_chain(dna_concat, offsets, k, t, N, seed)
+        return motifs, int(score)
+
+    rng = random.Random(seed)
+    np_rng = np.random.default_rng(seed)
+
+    # The window views are built once per dataset and reused on every step.
+    # Motifs live in one (t, k) array, so replacing one is a single row copy.
+    windows = dna.windows(k)
+    motifs = np.stack([seq_windows[rng.randrange(len(seq_windows))] for seq_windows in windows])
+
+    # Column counts are updated for the one motif that changes instead of
+    # being rebuilt from all t motifs on every step
+    cols = positions(k)
+    col_counts = count_motifs(motifs)
+
+    best_motifs = motifs.copy()
+    best_score = t * k - col_counts.max(axis=0).sum()
     
     for _ in range(N):
-        i = random.randint(0, t - 1)
-        current_motifs_except_i = [motifs[j] for j in range(t) if j != i]
-        profile = get_profile(current_motifs_except_i)
-        motifs[i] = profile_randomly_generated_kmer(dna[i], k, profile)
+        i = rng.randrange(t)
+        col_counts[motifs[i], cols] -= 1
+        log_profile = held_out_log_profile(col_counts)
+        motifs[i] = profile_randomly_generated_kmer(windows[i], log_profile, np_rng)
+        col_counts[motifs[i], cols] += 1
         
-        current_score = score_motifs(motifs)
+        current_score = t * k - col_counts.max(axis=0).sum()
         if current_score < best_score:
-            best_motifs = motifs[:]
+            best_motifs[:] = motifs
             best_score = current_score
             
-    return best_motifs, best_score
+    return best_motifs, int(best_score)
 
-def run_gibbs_with_restarts(dna, k, t, N, restarts):
-    global_best_motifs = []
-    global_best_score = float('inf')
-    
-    logging.info(f"Starting Gibbs Sampling: k={k}, steps={N}, restarts={restarts}")
-    
-    for i in tqdm(range(restarts), desc="Gibbs Restarts", unit="chain"):
-        motifs, score = gibbs_sampler_chain(dna, k, t, N)
-        if score < global_best_score:
-            global_best_score = score
-            global_best_motifs = motifs
-            logging.debug(f"New best score found: {score}")
+# Random draws are made for this many steps at a time in the batched sampler
+BATCH_DRAW_STEPS = 256
+
+def gibbs_sampler_batch(dna, k, t, N, seeds):
+    """
+    Runs one Gibbs chain per seed as a single (chains, t, k) tensor, so every step is
+    one vectorized update across all chains. Requires equal-length sequences.
+    Each chain draws only from its own generator, so its result depends on its seed alone.
+    """
+    windows = dna.stacked_windows(k)
+    n_windows = windows.shape[1]
+    R = len(seeds)
+    chains = np.arange(R)[:, None]
+    cols = positions(k)
+    gens = [np.random.default_rng(s % SEED_RANGE) for s in seeds]
+
+    starts = np.stack([g.integers(0, n_windows, size=t) for g in gens])
+    motifs_b = windows[np.arange(t), starts]
+    counts_b = np.zeros((R, 4, k), dtype=np.int64)
+    np.add.at(counts_b, (chains, motifs_b.reshape(R, -1), np.tile(cols, t)), 1)
+
+    best_motifs = motifs_b.copy()
+    best_scores = t * k - counts_b.max(axis=1).sum(axis=1)
+
+    for block in range(0, N, BATCH_DRAW_STEPS):
+        steps = min(BATCH_DRAW_STEPS, N - block)
+        picks = np.stack([g.integers(0, t, size=steps) for g in gens])
+        noise = np.stack([g.gumbel(size=(steps, n_windows)) for g in gens])
+
+        for step in range(steps):
+            i = picks[:, step]
+            counts_b[chains, motifs_b[chains[:, 0], i], cols] -= 1
+            log_profile = held_out_log_profile(counts_b)
+            seq_windows = windows[i]
+            logits = _score_windows(seq_windows, log_profile)
+            # Gumbel-max: the argmax of logits + Gumbel noise is a draw from softmax(logits)
+            j = _select(logits + noise[:, step], 'max')
+            motifs_b[chains[:, 0], i] = seq_windows[chains[:, 0], j]
+            counts_b[chains, motifs_b[chains[:, 0], i], cols] += 1
+
+            scores = t * k - counts_b.max(axis=1).sum(axis=1)
+            improved = scores < best_scores
+            best_motifs[improved] = motifs_b[improved]
+            best_scores[improved] = scores[improved]
+
+    return best_motifs, best_scores
+
+# DNA shared by every pool worker, set once by the initializer instead of pickled per task
+_worker_dna = None
+
+def _init_worker(dna):
+    global _worker_dna
+    _worker_dna = dna
+
+def _batch_worker(seeds, k, t, N):
+    return gibbs_sampler_batch(_worker_dna, k, t, N, seeds)
+
+def _chain_worker(seed, k, t, N):
+    # Shaped like a batch of one so both kinds of pool task are collected the same way
+    motifs, score = gibbs_sampler_chain(_worker_dna, k, t, N, seed=seed)
+    return motifs[None], np.array([score])
+
+def run_gibbs_with_restarts(dna, k, t, N, restarts, seed=None):
+    """
+    Runs `restarts` independent chains; chain i is seeded with seed + i.
+    """
+    if restarts < 1:
+        raise ValueError(f"restarts must be at least 1, got {restarts}")
+
+    base_seed = random.randrange(SEED_RANGE) if seed is None else seed
+    seeds = range(base_seed, base_seed + restarts)
+    logging.info(f"Starting Gibbs Sampling: k={k}, steps={N}, restarts={restarts}, seed={base_seed}")
+
+    if NUMBA_AVAILABLE:
+        # Chains run in parallel inside the compiled code, so there is no per-chain progress bar
+        logging.info("Running compiled Gibbs chains with Numba")
+        dna_concat, offsets = dna.packed()
+        chain_seeds = np.array([s % SEED_RANGE for s in seeds], dtype=np.int64)
+        all_motifs, all_scores = _gibbs_restarts(dna_concat, offsets, k, t, N, chain_seeds)
+        best = int(all_scores.argmin())
+        return all_motifs[best], int(all_scores[best])
+
+    # With equal-length sequences each pool worker advances its share of the restarts
+    # as one batched tensor chain; otherwise every restart is its own pool task.
+    # Results come back in seed order, so ties go to the lowest seed as in the Numba argmin.
+    n_workers = min(os.cpu_count() or 1, restarts)
+    if len({len(seq) for seq in dna}) == 1:
+        tasks = [list(batch) for batch in np.array_split(np.array(seeds), n_workers)]
+        worker = partial(_batch_worker, k=k, t=t, N=N)
+        unit = "batch"
+    else:
+        tasks = list(seeds)
+        worker = partial(_chain_worker, k=k, t=t, N=N)
+        unit = "chain"
+    all_motifs, all_scores = [], []
+    with mp.Pool(n_workers, initializer=_init_worker, initargs=(dna,)) as pool:
+        for motifs_b, scores in tqdm(pool.imap(worker, tasks), total=len(tasks), desc="Gibbs Restarts", unit=unit):
+            all_motifs.append(motifs_b)
+            all_scores.append(scores)
+            logging.debug(f"Best score in {unit}: {scores.min()}")
 
-    return global_best_motifs, global_best_score
+    all_motifs = np.concatenate(all_motifs)
+    all_scores = np.concatenate(all_scores)
+    best = int(all_scores.argmin())
+    return all_motifs[best], int(all_scores[best])
 
 # ==========================================
 # PART 3: Main Execution
@@ -212,8 +526,11 @@ def main():
     parser.add_argument("--k", type=int, default=8, help="Length of the motif")
     parser.add_argument("--iters", type=int, default=1000, help="Inner Gibbs iterations")
     parser.add_argument("--restarts", type=int, default=20, help="Random restarts")
+    parser.add_argument("--seed", type=int, default=None, help="Base random seed (chain i uses seed + i)")
     parser.add_argument("--verbose", action="store_true", help="Verbose logging")
     args = parser.parse_args()
+    if args.restarts < 1:
+        parser.error("--restarts must be at least 1")
     
     setup_logging(args.verbose)
     
@@ -222,7 +539,8 @@ def main():
         
     t = len(dna)
     
-    best_motifs, best_score = run_gibbs_with_restarts(dna, args.k, t, args.iters, args.restarts)
+    best_motifs, best_score = run_gibbs_with_restarts(dna, args.k, t, args.iters, args.restarts, args.seed)
+    best_motifs = [decode_sequence(m) for m in best_motifs]
     
     save_results_report("results_summary.txt", "found_motifs.csv", best_motifs, best_score, args, t)
     
@@ -1,33 +1,30 @@
-import random
-from motif_discovery import gibbs_sampler_chain, randomized_greedy_search, score_motifs
+import numpy as np
+from motif_discovery import (gibbs_sampler_chain, randomized_greedy_search, score_motifs,
+                             EncodedDNA, decode_sequence)
 
 # --- Helper to generate synthetic data ---
+rng = np.random.default_rng()
+
 def generate_synthetic_data(num_seqs, seq_len, k):
-    dna = []
     # 1. Create Random Background
-    for _ in range(num_seqs):
-        seq = ''.join(random.choice('ACGT') for _ in range(seq_len))
-        dna.append(seq)
+    dna = rng.integers(0, 4, size=(num_seqs, seq_len), dtype=np.uint8)
     
     # 2. Define Hidden Motif
-    hidden_motif = ''.join(random.choice('ACGT') for _ in range(k))
-    print(f"True Implanted Motif (Consensus): {hidden_motif}")
+    hidden_motif = rng.integers(0, 4, size=k, dtype=np.uint8)
+    print(f"True Implanted Motif (Consensus): {decode_sequence(hidden_motif)}")
     
-    implanted_dna = []
-    for seq in dna:
-        # 3. Mutate the motif before implanting!
-        # 30% chance to mutate one letter in the motif
-        motif_variant = list(hidden_motif)
-        if random.random() < 0.3: 
-            pos = random.randint(0, k-1)
-            motif_variant[pos] = random.choice('ACGT')
-        motif_variant = "".join(motif_variant)
+    # 3. Mutate the motif before implanting!
+    # 30% chance to mutate one letter in the motif
+    variants = np.tile(hidden_motif, (num_seqs, 1))
+    mutate = rng.random(num_seqs) < 0.3
+    mutate_pos = rng.integers(0, k, size=num_seqs)
+    variants[mutate, mutate_pos[mutate]] = rng.integers(0, 4, size=mutate.sum(), dtype=np.uint8)
 
-        idx = random.randint(0, seq_len - k)
-        new_seq = seq[:idx] + motif_variant + seq[idx+k:]
-        implanted_dna.append(new_seq)
+    # 4. Implant each variant at a random offset
+    idxs = rng.integers(0, seq_len - k + 1, size=num_seqs)
+    dna[np.arange(num_seqs)[:, None], idxs[:, None] + np.arange(k)] = variants
         
-    return implanted_dna, hidden_motif
+    return EncodedDNA(list(dna)), decode_sequence(hidden_motif)
 
 # --- Run the Comparison ---
 def compare_algorithms():
@@ -43,7 +40,7 @@ def compare_algorithms():
     # 2. Run Greedy (Baseline)
     greedy_result = randomized_greedy_search(dna, k, t)
     greedy_score = score_motifs(greedy_result)
-    greedy_consensus = greedy_result[0] # Simplified consensus
+    greedy_consensus = decode_sequence(greedy_result[0]) # Simplified consensus
     
     # 3. Run Gibbs (Your Algorithm)
     # Run a few restarts to be fair
@@ -53,7 +50,7 @@ def compare_algorithms():
         motifs, score = gibbs_sampler_chain(dna, k, t, 1000)
         if score < best_gibbs_score:
             best_gibbs_score = score
-            best_gibbs_motif = motifs[0]
+            best_gibbs_motif = decode_sequence(motifs[0])
             
     # 4. Print Results for your Report
     print(f"\nRESULTS:")
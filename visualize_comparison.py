@@ -1,37 +1,34 @@
-import random
+import numpy as np
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
 from tqdm import tqdm
-from motif_discovery import gibbs_sampler_chain, randomized_greedy_search, score_motifs
+from motif_discovery import (gibbs_sampler_chain, randomized_greedy_search, score_motifs,
+                             EncodedDNA, decode_sequence)
 
 # ==========================================
 # 1. Setup Data Generator (with Mutation)
 # ==========================================
+rng = np.random.default_rng()
+
 def generate_synthetic_data(num_seqs, seq_len, k):
-    dna = []
     # Background
-    for _ in range(num_seqs):
-        seq = ''.join(random.choice('ACGT') for _ in range(seq_len))
-        dna.append(seq)
+    dna = rng.integers(0, 4, size=(num_seqs, seq_len), dtype=np.uint8)
     
     # Hidden Motif
-    hidden_motif = ''.join(random.choice('ACGT') for _ in range(k))
+    hidden_motif = rng.integers(0, 4, size=k, dtype=np.uint8)
     
-    implanted_dna = []
-    for seq in dna:
-        # 30% Mutation Rate (Simulation of Biological Noise)
-        motif_variant = list(hidden_motif)
-        if random.random() < 0.3: 
-            pos = random.randint(0, k-1)
-            motif_variant[pos] = random.choice('ACGT')
-        motif_variant = "".join(motif_variant)
+    # 30% Mutation Rate (Simulation of Biological Noise)
+    variants = np.tile(hidden_motif, (num_seqs, 1))
+    mutate = rng.random(num_seqs) < 0.3
+    mutate_pos = rng.integers(0, k, size=num_seqs)
+    variants[mutate, mutate_pos[mutate]] = rng.integers(0, 4, size=mutate.sum(), dtype=np.uint8)
 
-        idx = random.randint(0, seq_len - k)
-        new_seq = seq[:idx] + motif_variant + seq[idx+k:]
-        implanted_dna.append(new_seq)
+    # Implant each variant at a random offset
+    idxs = rng.integers(0, seq_len - k + 1, size=num_seqs)
+    dna[np.arange(num_seqs)[:, None], idxs[:, None] + np.arange(k)] = variants
         
-    return implanted_dna, hidden_motif
+    return EncodedDNA(list(dna)), decode_sequence(hidden_motif)
 
 # ==========================================
 # 2. Run Statistical Simulation
@@ -61,7 +58,7 @@ def run_simulation_and_plot():
         results_data.append({"Algorithm": "Greedy", "Score": greedy_score})
         
         # Check Success
-        if greedy_res[0] == true_motif:
+        if decode_sequence(greedy_res[0]) == true_motif:
             success_counts["Greedy"] += 1
             
         # --- B. Run Gibbs (Best of 5 Restarts) ---
@@ -71,7 +68,7 @@ def run_simulation_and_plot():
             motifs, score = gibbs_sampler_chain(dna, k, t, 1000)
             if score < best_gibbs_score:
                 best_gibbs_score = score
-                best_gibbs_motif = motifs[0]
+                best_gibbs_motif = decode_sequence(motifs[0])
         
         # Store for Box Plot
         results_data.append({"Algorithm": "Gibbs", "Score": best_gibbs_score})